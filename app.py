@@ -22,6 +22,11 @@ import plotly.graph_objects as go
 import plotly.express as px
 import streamlit as st
 
+try:
+    import numba  # optional: JIT kernel for per-round aggregation of large workbooks
+except ModuleNotFoundError:
+    numba = None
+
 # -----------------------------
 # Page config & styling
 # -----------------------------
@@ -78,110 +83,207 @@ section.main > div {{ padding-top: 1rem; }}
 """
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+# --- Section headers (static HTML, rendered with st.html to skip markdown parsing) ---
+HEAD_OVERVIEW     = "<div class='section-head'><h3>Overview</h3></div>"
+HEAD_PURCHASE     = "<div class='section-head'><h3>Purchase</h3></div>"
+HEAD_SALES        = "<div class='section-head'><h3>Sales</h3></div>"
+HEAD_SUPPLY_CHAIN = "<div class='section-head'><h3>Supply Chain</h3></div>"
+HEAD_OPERATIONS   = "<div class='section-head'><h3>Operations</h3></div>"
+HEAD_IMPACT       = "<div class='section-head'><h3>Impact Matrix — Functional KPIs ↔ Financial KPIs</h3></div>"
+HEAD_DATA         = "<div class='section-head'><h3>Data Explorer</h3></div>"
+
+# --- Shared Plotly layout (merged at the top level of every figure's layout, where it takes
+# precedence over the template Streamlit's chart theme merges in) ---
+CHART_LAYOUT = dict(
+    margin=dict(l=10, r=10, t=40, b=10),
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+    template="plotly_white",
+)
+
 # -----------------------------
 # Utilities
 # -----------------------------
 @st.cache_data(show_spinner=False)
 def load_excel(path: str) -> dict:
-    """Load all relevant sheets, return dict of normalized DataFrames."""
-    xl = pd.ExcelFile(path)
+    """Load the sheets the dashboard reads, return dict of normalized DataFrames."""
+    xl = pd.ExcelFile(path, engine="openpyxl")
+    def norm_name(c):
+        return (
+            str(c)
+            .strip()
+            .lower()
+            .replace("\n"," ")
+            .replace("\r"," ")
+            .replace("  "," ")
+            .replace(" ","_")
+        )
+
     def norm(df):
         df2 = df.copy()
-        df2.columns = (
-            df2.columns
-            .str.strip()
-            .str.lower()
-            .str.replace("\n"," ", regex=False)
-            .str.replace("\r"," ", regex=False)
-            .str.replace("  "," ", regex=False)
-            .str.replace(" ","_", regex=False)
-        )
+        df2.columns = [norm_name(c) for c in df2.columns]
+        # Categorical string keys shrink the cached frames; measures stay float64 so sums and
+        # means match the workbook to the cent
+        obj_cols = df2.select_dtypes("object").columns
+        df2[obj_cols] = df2[obj_cols].astype("category")
         return df2
 
-    def get_sheet(name):
+    def get_sheet(name, cols=None):
+        """Read one sheet; `cols` (normalized names) trims the cached frame to the columns the dashboard uses."""
         if name in xl.sheet_names:
-            return norm(pd.read_excel(xl, sheet_name=name))
+            usecols = (lambda c: norm_name(c) in cols) if cols else None
+            df = norm(pd.read_excel(xl, sheet_name=name, usecols=usecols))
+            if cols and "round" in cols:
+                # Round is the x-axis of every chart: drop rows without one (as groupby would), then compact to int32
+                df = df.dropna(subset=["round"]).astype({"round": "int32"})
+            return df
         return None
 
-    df_product   = get_sheet("Product")
-    df_component = get_sheet("Component")
-    df_wh        = get_sheet("Warehouse, Salesarea")
-    # Optional sheets (won't break if absent)
-    df_customer  = get_sheet("Customer")
-    df_prod_wh   = get_sheet("Product - Warehouse")
+    df_product   = get_sheet("Product", [
+        "round","service_level_(pieces)","stock_(weeks)","forecast_error_(mape)","obsoletes_(%)",
+        "demand_per_week_(value)","gross_margin_per_week","production_plan_adherence_(%)",
+    ])
+    df_component = get_sheet("Component", [
+        "component","round","stock_(weeks)","component_availability_(%)","obsoletes_(%)","delivery_reliability_(%)",
+    ])
+    df_wh        = get_sheet("Warehouse, Salesarea", ["warehouse","round","cube_utilization_(%)"])
 
     return {
         "product": df_product,
         "component": df_component,
         "warehouse": df_wh,
-        "customer": df_customer,
-        "product_warehouse": df_prod_wh,
     }
 
-def pct(x, decimals=2):
-    if pd.isna(x): return None
-    return round(float(x)*100.0, decimals)
+def bc_mean(round_ids, vals, n):
+    """NaN-skipping mean of `vals` per id in 0..n-1 via np.bincount (NaN where an id has no values)."""
+    ok = ~np.isnan(vals)
+    sums = np.bincount(round_ids[ok], weights=vals[ok], minlength=n)
+    counts = np.bincount(round_ids[ok], minlength=n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+def bc_sum(round_ids, vals, n):
+    """NaN-skipping sum of `vals` per id in 0..n-1 via np.bincount."""
+    ok = ~np.isnan(vals)
+    return np.bincount(round_ids[ok], weights=vals[ok], minlength=n)
+
+# Below this many rows the JIT warm-up costs more than the bincount path saves
+NUMBA_MIN_ROWS = 200_000
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def group_sums_by_round(round_ids, values, nrounds):
+        """Per-round NaN-skipping sums and counts of each column of `values` (one pass per column)."""
+        nrows, ncols = values.shape
+        sums = np.zeros((nrounds, ncols), dtype=np.float64)
+        counts = np.zeros((nrounds, ncols), dtype=np.int64)
+        for j in numba.prange(ncols):
+            for i in range(nrows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    sums[round_ids[i], j] += v
+                    counts[round_ids[i], j] += 1
+        return sums, counts
+
+def round_agg(soa, spec):
+    """Per-round "mean"/"sum" reductions (NaN-skipping) over a dict of column arrays, indexed by round."""
+    rids = soa["round"]
+    nrounds = int(rids.max()) + 1 if len(rids) else 0
+
+    if numba is not None and len(rids) >= NUMBA_MIN_ROWS:
+        values = np.column_stack([soa[src] for src, _ in spec.values()]).astype(np.float64)
+        sums, counts = group_sums_by_round(rids, values, nrounds)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        data = {name: (means if how == "mean" else sums)[:, j] for j, (name, (_, how)) in enumerate(spec.items())}
+    else:
+        data = {name: (bc_mean if how == "mean" else bc_sum)(rids, soa[src], nrounds)
+                for name, (src, how) in spec.items()}
+
+    present = np.bincount(rids, minlength=nrounds) > 0
+    return pd.DataFrame(
+        {name: vals[present] for name, vals in data.items()},
+        index=pd.Index(np.flatnonzero(present).astype("int32"), name="round"),
+    )
 
-def num(x, decimals=2):
-    if pd.isna(x): return None
-    return round(float(x), decimals)
+def round_pivot(rids, codes, names, vals, key):
+    """Round x `key` mean table (as groupby([round, key]).mean().unstack()) from integer key codes."""
+    ok = codes >= 0
+    nrounds = int(rids.max()) + 1 if len(rids) else 0
+    nkeys = len(names)
+    means = bc_mean(rids[ok] * nkeys + codes[ok], vals[ok], nrounds * nkeys).reshape(nrounds, nkeys)
+    present = np.bincount(rids[ok], minlength=nrounds) > 0
+    out = pd.DataFrame(means[present], columns=pd.Index(names, name=key))
+    out.insert(0, "round", np.flatnonzero(present).astype("int32"))
+    return out
 
-def layout_kpi(title, value, sub=None, suffix=""):
-    v = "-" if value is None else f"{value}{suffix}"
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV export of a frame, cached on its contents so reruns don't re-serialize it."""
+    return df.to_csv(index=False).encode("utf-8")
+
+def kpi_values(row, cols, scale=1.0, suffix="", decimals=2):
+    """Format several KPI values of one row at once, with a vectorized missing check ("-" for missing)."""
+    vals = np.array([row.get(c, np.nan) for c in cols], dtype=np.float64)
+    missing = np.isnan(vals)
+    # Python's round() on the scaled float keeps the cards identical to the old pct()/num() output
+    return {c: ("-" if m else f"{round(float(v) * scale, decimals)}{suffix}") for c, v, m in zip(cols, vals, missing)}
+
+def layout_kpi(title, value, sub=None):
     st.markdown(
         f"""
         <div class="kpi-card">
           <div class="kpi-title">{title}</div>
-          <div class="kpi-value">{v}</div>
+          <div class="kpi-value">{value}</div>
           <div class="kpi-sub">{sub or ""}</div>
         </div>
         """,
         unsafe_allow_html=True,
     )
 
+# WebGL only pays off for long series, and browsers cap active WebGL contexts (~16 in Chrome),
+# so per-round charts stay on the SVG renderer
+SCATTERGL_MIN_POINTS = 5_000
+
+def scatter_trace(xs):
+    """Scatter trace class for a series of this length: Scattergl for long series, Scatter otherwise."""
+    return go.Scattergl if len(xs) >= SCATTERGL_MIN_POINTS else go.Scatter
+
+# Charts are memoized on the frame contents, so revisiting a round window reuses the built figure
+FRAME_HASH = {pd.DataFrame: lambda d: (tuple(d.columns), pd.util.hash_pandas_object(d, index=True).values.tobytes())}
+
+@st.cache_resource(show_spinner=False, hash_funcs=FRAME_HASH)
 def line_chart(df, x, y, title=None, yaxis_title=None, color=None, secondary_y=None):
-    fig = go.Figure()
-    if isinstance(y, list):
-        for col in y:
-            fig.add_trace(go.Scatter(x=df[x], y=df[col], mode="lines+markers", name=col))
-    else:
-        fig.add_trace(go.Scatter(x=df[x], y=df[y], mode="lines+markers", name=y))
+    cols = y if isinstance(y, list) else [y]
+    sec_cols = secondary_y if secondary_y and isinstance(secondary_y, list) else []
+    xs = df[x].to_numpy()
+    ys_map = {c: df[c].to_numpy() for c in cols + sec_cols}
+    Scatter = scatter_trace(xs)
 
-    if secondary_y and isinstance(secondary_y, list):
-        for col in secondary_y:
-            fig.add_trace(go.Scatter(x=df[x], y=df[col], mode="lines+markers", name=col, yaxis="y2"))
+    traces = [Scatter(x=xs, y=ys_map[col], mode="lines+markers", name=col) for col in cols]
+    layout = dict(CHART_LAYOUT, title=title or "", yaxis=dict(title=yaxis_title or ""))
 
-        fig.update_layout(
-            yaxis=dict(title=yaxis_title or ""),
-            yaxis2=dict(title="", overlaying='y', side='right', showgrid=False),
-        )
-    else:
-        fig.update_layout(yaxis=dict(title=yaxis_title or ""))
+    if sec_cols:
+        traces += [Scatter(x=xs, y=ys_map[col], mode="lines+markers", name=col, yaxis="y2") for col in sec_cols]
+        layout["yaxis2"] = dict(title="", overlaying='y', side='right', showgrid=False)
 
-    fig.update_layout(
-        margin=dict(l=10, r=10, t=40, b=10),
-        title=title or "",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-        template="plotly_white",
-    )
-    return fig
+    return go.Figure(dict(data=traces, layout=layout))
 
+@st.cache_resource(show_spinner=False, hash_funcs=FRAME_HASH)
 def bar_line_combo(df, x, bar_y, line_y, title=None, y1_title="", y2_title=""):
-    fig = go.Figure()
-    fig.add_trace(go.Bar(x=df[x], y=df[bar_y], name=bar_y, marker_color=ACCENT))
-    fig.add_trace(go.Scatter(x=df[x], y=df[line_y], name=line_y, yaxis="y2", mode="lines+markers"))
-
-    fig.update_layout(
+    xs = df[x].to_numpy()
+    traces = [
+        go.Bar(x=xs, y=df[bar_y].to_numpy(), name=bar_y, marker_color=ACCENT),
+        scatter_trace(xs)(x=xs, y=df[line_y].to_numpy(), name=line_y, yaxis="y2", mode="lines+markers"),
+    ]
+    layout = dict(
+        CHART_LAYOUT,
         title=title or "",
         xaxis=dict(title=x),
         yaxis=dict(title=y1_title),
         yaxis2=dict(title=y2_title, overlaying='y', side='right'),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-        margin=dict(l=10, r=10, t=40, b=10),
-        template="plotly_white",
         barmode="group",
     )
-    return fig
+    return go.Figure(dict(data=traces, layout=layout))
 
 # -----------------------------
 # Data prep (using your real Excel)
@@ -189,74 +291,121 @@ def bar_line_combo(df, x, bar_y, line_y, title=None, y1_title="", y2_title=""):
 DATA_PATH = "TFC_0_6.xlsx"     # Upload to repo root
 LOGO_PATH = "logo_tfc.png"     # Upload to repo root
 
-dfs = load_excel(DATA_PATH)
-prod = dfs["product"]
-comp = dfs["component"]
-wh   = dfs["warehouse"]
+@st.cache_data(show_spinner=False)
+def build_overview(path: str) -> dict:
+    """Run the full aggregation pipeline once, return dict of everything the page reads (None if sheets missing)."""
+    dfs = load_excel(path)
+    prod = dfs["product"]
+    comp = dfs["component"]
+    wh   = dfs["warehouse"]
+
+    if prod is None or comp is None or wh is None:
+        return None
+
+    # Column-wise (SoA) views of the source sheets for the per-round reductions
+    prod_soa = {c: prod[c].to_numpy() for c in prod.columns}
+    comp_soa = {c: comp[c].to_numpy() for c in comp.columns}
+
+    # Product aggregates by round
+    prod_agg = round_agg(prod_soa, dict(
+        avg_service_pct=("service_level_(pieces)", "mean"),
+        fg_stock_weeks_avg=("stock_(weeks)", "mean"),
+        mape_pct=("forecast_error_(mape)", "mean"),
+        product_obsol_pct_avg=("obsoletes_(%)","mean"),
+        realized_revenue=("demand_per_week_(value)","sum"),
+        gross_margin_per_week=("gross_margin_per_week","sum"),
+        ppa=("production_plan_adherence_(%)","mean"),
+    )).reset_index()
+
+    # Financials
+    prod_agg["cogs"] = prod_agg["realized_revenue"] - prod_agg["gross_margin_per_week"]
+
+    # Component aggregates
+    comp_agg = round_agg(comp_soa, dict(
+        component_availability_pct_avg=("component_availability_(%)","mean"),
+        component_stock_weeks_avg=("stock_(weeks)","mean"),
+        component_obsolescence_pct_avg=("obsoletes_(%)","mean"),
+        component_delivery_reliability_pct_avg=("delivery_reliability_(%)","mean"),
+    )).reset_index()
+
+    # Vitamin C obsolescence by round
+    comp_lc = comp["component"].str.lower()
+    is_vitc = comp_lc.str.contains("vitamin", regex=False, na=False).to_numpy()
+    vitc_obsol = round_agg(
+        {c: comp_soa[c][is_vitc] for c in ("round", "obsoletes_(%)")},
+        {"obsoletes_(%)": ("obsoletes_(%)", "mean")},
+    ).reset_index()
+
+    # Component pivots (round x component means from one bincount over a combined key)
+    comp_cat = comp["component"].cat.remove_unused_categories()
+    comp_codes = comp_cat.cat.codes.to_numpy()
+    comp_names = list(comp_cat.cat.categories)
+    weeks_pivot = round_pivot(comp_soa["round"], comp_codes, comp_names, comp_soa["stock_(weeks)"], "component")
+    avail_pivot = round_pivot(comp_soa["round"], comp_codes, comp_names, comp_soa["component_availability_(%)"], "component")
+
+    # Warehouse/Operations: inbound (raw materials) and outbound (finished goods) in one reduction,
+    # each masked to NaN outside its warehouse so the means skip the other rows
+    wh_lc = wh["warehouse"].str.lower()
+    wh_util = wh["cube_utilization_(%)"].to_numpy()
+    is_inbound = wh_lc.str.contains("raw materials", regex=False, na=False).to_numpy()
+    is_outbound = wh_lc.str.contains("finished goods", regex=False, na=False).to_numpy()
+    util = round_agg(
+        {"round": wh["round"].to_numpy(),
+         "inbound": np.where(is_inbound, wh_util, np.nan),
+         "outbound": np.where(is_outbound, wh_util, np.nan)},
+        dict(inbound_util=("inbound", "mean"), outbound_util=("outbound", "mean")),
+    ).reset_index()
+
+    # Join on the shared round index (one aligned concat instead of a merge chain)
+    rounds_df = pd.DataFrame({"round": sorted(prod_agg["round"].unique())})
+    frames = [f.set_index("round") for f in (prod_agg, comp_agg, util)]
+    overview = (
+        pd.concat(frames, axis=1)
+        .reindex(rounds_df["round"].values)
+        .rename_axis("round")
+        .reset_index()
+    )
+
+    return {
+        "overview": overview,
+        "weeks_pivot": weeks_pivot,
+        "avail_pivot": avail_pivot,
+        "vitc_obsol": vitc_obsol,
+        "comp_list": [c for c in weeks_pivot.columns if c != "round"],
+    }
+
+@st.cache_data(show_spinner=False)
+def filter_overview(ov_all: pd.DataFrame, lo: int, hi: int) -> pd.DataFrame:
+    """Slice the overview to the selected round range."""
+    mask = (ov_all["round"] >= lo) & (ov_all["round"] <= hi)
+    return ov_all[mask].copy()
 
-if prod is None or comp is None or wh is None:
+tables = build_overview(DATA_PATH)
+if tables is None:
     st.error("Required sheets not found. Please make sure `TFC_0_6.xlsx` has sheets: Product, Component, Warehouse, Salesarea.")
     st.stop()
 
-# Product aggregates by round
-prod_agg = prod.groupby("round").agg(
-    avg_service_pct=("service_level_(pieces)", "mean"),
-    fg_stock_weeks_avg=("stock_(weeks)", "mean"),
-    mape_pct=("forecast_error_(mape)", "mean"),
-    product_obsol_pct_avg=("obsoletes_(%)","mean"),
-    realized_revenue=("demand_per_week_(value)","sum"),
-    gross_margin_per_week=("gross_margin_per_week","sum"),
-).reset_index()
-
-# Financials
-prod_agg["cogs"] = prod_agg["realized_revenue"] - prod_agg["gross_margin_per_week"]
-
-# Component aggregates
-comp_agg = comp.groupby("round").agg(
-    component_availability_pct_avg=("component_availability_(%)","mean"),
-    component_stock_weeks_avg=("stock_(weeks)","mean"),
-    component_obsolescence_pct_avg=("obsoletes_(%)","mean"),
-    component_delivery_reliability_pct_avg=("delivery_reliability_(%)","mean"),
-).reset_index()
-
-# Vitamin C obsolescence by round
-vitc = comp[comp["component"].str.contains("vitamin", case=False, na=False)]
-vitc_obsol = vitc.groupby("round")["obsoletes_(%)"].mean().reset_index()
-
-# Component pivots
-weeks_pivot = comp.pivot_table(index="round", columns="component", values="stock_(weeks)", aggfunc="mean").reset_index()
-avail_pivot = comp.pivot_table(index="round", columns="component", values="component_availability_(%)", aggfunc="mean").reset_index()
-
-# Warehouse/Operations
-inbound = wh[wh["warehouse"].str.contains("raw materials", case=False, na=False)] \
-            .groupby("round")["cube_utilization_(%)"].mean().reset_index().rename(columns={"cube_utilization_(%)":"inbound_util"})
-outbound = wh[wh["warehouse"].str.contains("finished goods", case=False, na=False)] \
-            .groupby("round")["cube_utilization_(%)"].mean().reset_index().rename(columns={"cube_utilization_(%)":"outbound_util"})
-ppa = prod.groupby("round")["production_plan_adherence_(%)"].mean().reset_index().rename(columns={"production_plan_adherence_(%)":"ppa"})
-
-# Join common round index
-rounds_df = pd.DataFrame({"round": sorted(prod_agg["round"].unique())})
-overview = (
-    rounds_df
-    .merge(prod_agg, on="round", how="left")
-    .merge(comp_agg, on="round", how="left")
-    .merge(inbound, on="round", how="left")
-    .merge(outbound, on="round", how="left")
-    .merge(ppa, on="round", how="left")
-)
+ov_all      = tables["overview"]
+weeks_pivot = tables["weeks_pivot"]
+avail_pivot = tables["avail_pivot"]
+vitc_obsol  = tables["vitc_obsol"]
+comp_list   = tables["comp_list"]
 
 # -----------------------------
 # Sidebar filters
 # -----------------------------
 st.sidebar.image(LOGO_PATH, caption="The Fresh Connection", use_column_width=True)
 st.sidebar.markdown("### Filters")
-min_r, max_r = int(overview["round"].min()), int(overview["round"].max())
+min_r, max_r = int(ov_all["round"].min()), int(ov_all["round"].max())
 sel = st.sidebar.slider("Round range", min_value=min_r, max_value=max_r, value=(min_r, max_r), step=1)
-mask = (overview["round"] >= sel[0]) & (overview["round"] <= sel[1])
-ov = overview[mask].copy()
+ov = filter_overview(ov_all, sel[0], sel[1])
 
-latest = int(ov["round"].max())
-ov_latest = ov[ov["round"]==latest].iloc[0].to_dict()
+ov_latest = ov.iloc[-1]  # overview is sorted by round, so the last row is the latest round
+kpi = {
+    **kpi_values(ov_latest, ["avg_service_pct","component_availability_pct_avg","ppa","inbound_util","outbound_util"],
+                 scale=100.0, suffix="%"),
+    **kpi_values(ov_latest, ["fg_stock_weeks_avg","gross_margin_per_week"]),
+}
 
 # -----------------------------
 # Header
@@ -272,13 +421,13 @@ with col_title:
 # KPI Cards (latest round)
 # -----------------------------
 c1, c2, c3, c4, c5 = st.columns(5)
-with c1: layout_kpi("Avg Product Service Level", pct(ov_latest["avg_service_pct"]), suffix="%")
-with c2: layout_kpi("Component Availability", pct(ov_latest["component_availability_pct_avg"]), suffix="%")
-with c3: layout_kpi("FG Stock Weeks", num(ov_latest["fg_stock_weeks_avg"]))
-with c4: layout_kpi("Production Plan Adherence", pct(ov_latest["ppa"]), suffix="%")
-with c5: layout_kpi("Gross Margin / wk", num(ov_latest["gross_margin_per_week"]))
+with c1: layout_kpi("Avg Product Service Level", kpi["avg_service_pct"])
+with c2: layout_kpi("Component Availability", kpi["component_availability_pct_avg"])
+with c3: layout_kpi("FG Stock Weeks", kpi["fg_stock_weeks_avg"])
+with c4: layout_kpi("Production Plan Adherence", kpi["ppa"])
+with c5: layout_kpi("Gross Margin / wk", kpi["gross_margin_per_week"])
 
-st.markdown("<div class='section-head'><h3>Overview</h3></div>", unsafe_allow_html=True)
+st.html(HEAD_OVERVIEW)
 oc1, oc2 = st.columns(2)
 with oc1:
     st.plotly_chart(
@@ -305,156 +454,172 @@ with oc4:
         use_container_width=True)
 
 # -----------------------------
-# Purchase
+# Section navigation (only the selected section's figures are built on each rerun)
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Purchase</h3></div>", unsafe_allow_html=True)
-st.write(
-    "- Suppliers unchanged; lot sizes unchanged.\n"
-    "- Increased delivery windows to improve delivery reliability.\n"
-    "- Trade-off: reliability ↑, flexibility ↓; Vitamin C overstock risk."
-)
-pc1, pc2 = st.columns(2)
-with pc1:
-    st.plotly_chart(
-        line_chart(ov, "round",
-                   ["component_delivery_reliability_pct_avg","component_availability_pct_avg"],
-                   title="Delivery Reliability vs Component Availability (%, by Round)",
-                   yaxis_title="%"),
-        use_container_width=True)
-with pc2:
-    st.plotly_chart(
-        line_chart(ov, "round",
-                   ["component_obsolescence_pct_avg","component_stock_weeks_avg"],
-                   title="Component Obsolescence % vs Stock Weeks (by Round)",
-                   yaxis_title="Value"),
-        use_container_width=True)
+SECTIONS = ["Purchase", "Sales", "Supply Chain", "Operations", "Impact Matrix", "Data Explorer"]
+section = st.radio("Section", SECTIONS, horizontal=True, label_visibility="collapsed")
 
-# Component small multiples (weeks + availability)
-st.markdown("**Component Inventory & Availability by Round**")
-if not weeks_pivot.empty:
-    comp_list = [c for c in weeks_pivot.columns if c != "round"]
-    cc1, cc2 = st.columns(2)
-    with cc1:
-        tabs = st.tabs([f"Stock Weeks — {c}" for c in comp_list[:3]])
-        for i, c in enumerate(comp_list[:3]):
-            with tabs[i]:
-                fig = line_chart(weeks_pivot, "round", [c], title=f"{c} — Weeks of Stock", yaxis_title="Weeks")
-                st.plotly_chart(fig, use_container_width=True)
-    with cc2:
-        tabs2 = st.tabs([f"Availability — {c}" for c in comp_list[:3]])
-        for i, c in enumerate(comp_list[:3]):
-            with tabs2[i]:
-                fig = line_chart(avail_pivot, "round", [c], title=f"{c} — Availability %", yaxis_title="%")
-                st.plotly_chart(fig, use_container_width=True)
-
-# Vitamin C obsolescence callout
-if not vitc_obsol.empty:
-    fig_vc = line_chart(vitc_obsol, "round", ["obsoletes_(%)"], title="Vitamin C Obsolescence (%)", yaxis_title="%")
-    st.plotly_chart(fig_vc, use_container_width=True)
+# -----------------------------
+# Purchase
+# -----------------------------
+if section == "Purchase":
+    st.html(HEAD_PURCHASE)
+    st.write(
+        "- Suppliers unchanged; lot sizes unchanged.\n"
+        "- Increased delivery windows to improve delivery reliability.\n"
+        "- Trade-off: reliability ↑, flexibility ↓; Vitamin C overstock risk."
+    )
+    pc1, pc2 = st.columns(2)
+    with pc1:
+        st.plotly_chart(
+            line_chart(ov, "round",
+                       ["component_delivery_reliability_pct_avg","component_availability_pct_avg"],
+                       title="Delivery Reliability vs Component Availability (%, by Round)",
+                       yaxis_title="%"),
+            use_container_width=True)
+    with pc2:
+        st.plotly_chart(
+            line_chart(ov, "round",
+                       ["component_obsolescence_pct_avg","component_stock_weeks_avg"],
+                       title="Component Obsolescence % vs Stock Weeks (by Round)",
+                       yaxis_title="Value"),
+            use_container_width=True)
+
+    # Component small multiples (weeks + availability)
+    st.markdown("**Component Inventory & Availability by Round**")
+    if not weeks_pivot.empty:
+        cc1, cc2 = st.columns(2)
+        with cc1:
+            tabs = st.tabs([f"Stock Weeks — {c}" for c in comp_list[:3]])
+            for i, c in enumerate(comp_list[:3]):
+                with tabs[i]:
+                    fig = line_chart(weeks_pivot, "round", [c], title=f"{c} — Weeks of Stock", yaxis_title="Weeks")
+                    st.plotly_chart(fig, use_container_width=True)
+        with cc2:
+            tabs2 = st.tabs([f"Availability — {c}" for c in comp_list[:3]])
+            for i, c in enumerate(comp_list[:3]):
+                with tabs2[i]:
+                    fig = line_chart(avail_pivot, "round", [c], title=f"{c} — Availability %", yaxis_title="%")
+                    st.plotly_chart(fig, use_container_width=True)
+
+    # Vitamin C obsolescence callout
+    if not vitc_obsol.empty:
+        fig_vc = line_chart(vitc_obsol, "round", ["obsoletes_(%)"], title="Vitamin C Obsolescence (%)", yaxis_title="%")
+        st.plotly_chart(fig_vc, use_container_width=True)
 
 # -----------------------------
 # Sales
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Sales</h3></div>", unsafe_allow_html=True)
-st.write(
-    "- Focused on Food & Grocery to protect profitability.\n"
-    "- Reduced service to Land Market & Dominics when needed.\n"
-    "- Goal: meet SLAs while managing forecast error."
-)
-sc1, sc2 = st.columns(2)
-with sc1:
-    st.plotly_chart(
-        line_chart(ov, "round", ["avg_service_pct"], title="Average Service Level (%, by Round)", yaxis_title="%"),
-        use_container_width=True)
-with sc2:
+if section == "Sales":
+    st.html(HEAD_SALES)
+    st.write(
+        "- Focused on Food & Grocery to protect profitability.\n"
+        "- Reduced service to Land Market & Dominics when needed.\n"
+        "- Goal: meet SLAs while managing forecast error."
+    )
+    sc1, sc2 = st.columns(2)
+    with sc1:
+        st.plotly_chart(
+            line_chart(ov, "round", ["avg_service_pct"], title="Average Service Level (%, by Round)", yaxis_title="%"),
+            use_container_width=True)
+    with sc2:
+        st.plotly_chart(
+            line_chart(ov, "round", ["mape_pct"], title="Forecast Error (MAPE %, by Round)", yaxis_title="%"),
+            use_container_width=True)
+
     st.plotly_chart(
-        line_chart(ov, "round", ["mape_pct"], title="Forecast Error (MAPE %, by Round)", yaxis_title="%"),
+        bar_line_combo(ov, "round", "realized_revenue", "product_obsol_pct_avg",
+                       title="Revenue (bars) vs FG Obsolescence % (line)", y1_title="Revenue", y2_title="Obsolescence %"),
         use_container_width=True)
 
-st.plotly_chart(
-    bar_line_combo(ov, "round", "realized_revenue", "product_obsol_pct_avg",
-                   title="Revenue (bars) vs FG Obsolescence % (line)", y1_title="Revenue", y2_title="Obsolescence %"),
-    use_container_width=True)
-
 # -----------------------------
 # Supply Chain
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Supply Chain</h3></div>", unsafe_allow_html=True)
-st.plotly_chart(
-    line_chart(ov, "round", ["component_availability_pct_avg"], title="Component Availability (%, by Round)", yaxis_title="%"),
-    use_container_width=True)
-st.plotly_chart(
-    line_chart(ov, "round", ["fg_stock_weeks_avg"], title="FG Stock Weeks (by Round)", yaxis_title="Weeks"),
-    use_container_width=True)
+if section == "Supply Chain":
+    st.html(HEAD_SUPPLY_CHAIN)
+    st.plotly_chart(
+        line_chart(ov, "round", ["component_availability_pct_avg"], title="Component Availability (%, by Round)", yaxis_title="%"),
+        use_container_width=True)
+    st.plotly_chart(
+        line_chart(ov, "round", ["fg_stock_weeks_avg"], title="FG Stock Weeks (by Round)", yaxis_title="Weeks"),
+        use_container_width=True)
 
 # -----------------------------
 # Operations
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Operations</h3></div>", unsafe_allow_html=True)
-oc1, oc2, oc3 = st.columns(3)
-with oc1: layout_kpi("Inbound Cube Utilization", pct(ov_latest.get("inbound_util")), "Target 85–90%", suffix="%")
-with oc2: layout_kpi("Outbound Cube Utilization", pct(ov_latest.get("outbound_util")), "Target 85–90%", suffix="%")
-with oc3: layout_kpi("Plan Adherence", pct(ov_latest.get("ppa")), "Higher is better", suffix="%")
-
-st.plotly_chart(
-    line_chart(ov, "round", ["inbound_util","outbound_util"], title="Cube Utilization (%, by Round)", yaxis_title="%"),
-    use_container_width=True)
-st.plotly_chart(
-    line_chart(ov, "round", ["ppa"], title="Production Plan Adherence (%, by Round)", yaxis_title="%"),
-    use_container_width=True)
+if section == "Operations":
+    st.html(HEAD_OPERATIONS)
+    oc1, oc2, oc3 = st.columns(3)
+    with oc1: layout_kpi("Inbound Cube Utilization", kpi["inbound_util"], "Target 85–90%")
+    with oc2: layout_kpi("Outbound Cube Utilization", kpi["outbound_util"], "Target 85–90%")
+    with oc3: layout_kpi("Plan Adherence", kpi["ppa"], "Higher is better")
+
+    st.plotly_chart(
+        line_chart(ov, "round", ["inbound_util","outbound_util"], title="Cube Utilization (%, by Round)", yaxis_title="%"),
+        use_container_width=True)
+    st.plotly_chart(
+        line_chart(ov, "round", ["ppa"], title="Production Plan Adherence (%, by Round)", yaxis_title="%"),
+        use_container_width=True)
 
 # -----------------------------
 # Impact Matrix (Functional → Financial)
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Impact Matrix — Functional KPIs ↔ Financial KPIs</h3></div>",
-            unsafe_allow_html=True)
-
-im1, im2 = st.columns(2)
-with im1:
-    fig = line_chart(ov, "round",
-                     ["component_delivery_reliability_pct_avg", "component_availability_pct_avg"],
-                     title="Purchase → Reliability & Availability (proxy for COGS risk)", yaxis_title="%")
-    st.plotly_chart(fig, use_container_width=True)
-    st.caption("Higher reliability supports availability and reduces stockout/expedite risk; excessive component stock increases handling/COGS.")
-
-with im2:
-    fig = bar_line_combo(ov, "round", "realized_revenue", "avg_service_pct",
-                         title="Sales → Service Level (line) vs Revenue (bars)", y1_title="Revenue", y2_title="Service %")
-    st.plotly_chart(fig, use_container_width=True)
-    st.caption("Service protects realized revenue; service dips correlate with revenue softness.")
-
-im3, im4 = st.columns(2)
-with im3:
-    fig = line_chart(ov, "round", ["component_availability_pct_avg", "realized_revenue"],
-                     title="Supply Chain → Availability vs Revenue", yaxis_title="", secondary_y=["realized_revenue"])
-    st.plotly_chart(fig, use_container_width=True)
-    st.caption("Availability >95% preserves revenue; risk managed using safety stocks.")
-
-with im4:
-    fig = line_chart(ov, "round", ["outbound_util", "ppa"],
-                     title="Operations → Utilization vs Plan Adherence (cost drivers)", yaxis_title="%")
-    st.plotly_chart(fig, use_container_width=True)
-    st.caption("Utilization near 85–90% controls indirect costs; low adherence can raise COGS through expediting/rework.")
+if section == "Impact Matrix":
+    st.html(HEAD_IMPACT)
+
+    im1, im2 = st.columns(2)
+    with im1:
+        fig = line_chart(ov, "round",
+                         ["component_delivery_reliability_pct_avg", "component_availability_pct_avg"],
+                         title="Purchase → Reliability & Availability (proxy for COGS risk)", yaxis_title="%")
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Higher reliability supports availability and reduces stockout/expedite risk; excessive component stock increases handling/COGS.")
+
+    with im2:
+        fig = bar_line_combo(ov, "round", "realized_revenue", "avg_service_pct",
+                             title="Sales → Service Level (line) vs Revenue (bars)", y1_title="Revenue", y2_title="Service %")
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Service protects realized revenue; service dips correlate with revenue softness.")
+
+    im3, im4 = st.columns(2)
+    with im3:
+        fig = line_chart(ov, "round", ["component_availability_pct_avg", "realized_revenue"],
+                         title="Supply Chain → Availability vs Revenue", yaxis_title="", secondary_y=["realized_revenue"])
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Availability >95% preserves revenue; risk managed using safety stocks.")
+
+    with im4:
+        fig = line_chart(ov, "round", ["outbound_util", "ppa"],
+                         title="Operations → Utilization vs Plan Adherence (cost drivers)", yaxis_title="%")
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Utilization near 85–90% controls indirect costs; low adherence can raise COGS through expediting/rework.")
 
 # -----------------------------
 # Data Explorer
 # -----------------------------
-st.markdown("<div class='section-head'><h3>Data Explorer</h3></div>", unsafe_allow_html=True)
-
-with st.expander("Per-round KPI Table"):
-    show_cols = [
-        "round","avg_service_pct","component_availability_pct_avg","fg_stock_weeks_avg",
-        "mape_pct","product_obsol_pct_avg","realized_revenue","cogs","gross_margin_per_week",
-        "inbound_util","outbound_util","ppa"
-    ]
-    tidy = ov[show_cols].copy()
-    # scale percents nicely for display
-    pct_cols = ["avg_service_pct","component_availability_pct_avg","mape_pct","product_obsol_pct_avg",
-                "inbound_util","outbound_util","ppa"]
-    for c in pct_cols:
-        tidy[c] = (tidy[c]*100).round(2)
-    st.dataframe(tidy, use_container_width=True)
-    st.download_button("Download CSV", data=tidy.to_csv(index=False), file_name="tropic_kpis_rounds.csv", mime="text/csv")
+if section == "Data Explorer":
+    st.html(HEAD_DATA)
+
+    with st.expander("Per-round KPI Table"):
+        show_cols = [
+            "round","avg_service_pct","component_availability_pct_avg","fg_stock_weeks_avg",
+            "mape_pct","product_obsol_pct_avg","realized_revenue","cogs","gross_margin_per_week",
+            "inbound_util","outbound_util","ppa"
+        ]
+        tidy = ov[show_cols].copy()
+        # scale percents nicely for display
+        pct_cols = ["avg_service_pct","component_availability_pct_avg","mape_pct","product_obsol_pct_avg",
+                    "inbound_util","outbound_util","ppa"]
+        tidy[pct_cols] = (tidy[pct_cols].to_numpy() * 100).round(2)
+        # Arrow-backed dtypes serialize to the frontend without a NumPy->Arrow conversion;
+        # the percent suffix is applied client-side by the column config
+        tidy = tidy.convert_dtypes(dtype_backend="pyarrow")
+        st.dataframe(
+            tidy,
+            use_container_width=True,
+            column_config={c: st.column_config.NumberColumn(format="%.2f%%") for c in pct_cols},
+        )
+        st.download_button("Download CSV", data=to_csv_bytes(tidy), file_name="tropic_kpis_rounds.csv", mime="text/csv")
 
 # -----------------------------
 # Footer